@@ -1,14 +1,13 @@
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from rich import print
 from typer import Argument, Option, Typer
 
-from src.csv import generate_csv
 from src.helpers import create_folder, reset_folder
-from src.meta import Base, generate_meta, get_base_meta_data
-from src.python import generate_python
-from src.typescript import generate_typescript
+
+if TYPE_CHECKING:
+    from src.meta import Base
 
 app = Typer()
 
@@ -18,6 +17,8 @@ def meta(
     folder: Annotated[str, Argument(help="Path to the output folder")],
 ):
     """Fetch Airtable metadata into a json file."""
+    from src.meta import generate_meta, get_base_meta_data
+
     metadata = get_base_meta_data()
     folder_path = Path(folder)
     folder_path.mkdir(parents=True, exist_ok=True)
@@ -30,6 +31,9 @@ def csv(
     fresh: Annotated[bool, Option(help="Generate fresh property names instead of using custom names if they exist.")] = False,
 ):
     """Export Airtable metadata to CSV format."""
+    from src.csv import generate_csv
+    from src.meta import Base
+
     folder_path = reset_folder(Path(folder))
     base = Base.new(csv_folder=folder_path)
     generate_csv(base=base, folder=folder_path, fresh=fresh)
@@ -45,6 +49,10 @@ def py(
     package_prefix: Annotated[str, Option(help="Use if the code is not generated at the root level of the package")] = "",
 ):
     """Generate types and models in Python"""
+    from src.csv import generate_csv
+    from src.meta import Base
+    from src.python import generate_python
+
     folder_path = reset_folder(Path(folder))
     csv_folder_path = Path(csv_folder) if csv_folder else folder_path
     base = Base.new(csv_folder=csv_folder_path)
@@ -66,6 +74,10 @@ def ts(
     fresh: Annotated[bool, Option(help="Generate fresh property names instead of using custom names if they exist.")] = False,
 ):
     """Generate types and models in TypeScript"""
+    from src.csv import generate_csv
+    from src.meta import Base
+    from src.typescript import generate_typescript
+
     folder_path = reset_folder(Path(folder))
     csv_folder_path = Path(csv_folder) if csv_folder else folder_path
     base = Base.new(csv_folder=csv_folder_path)
@@ -77,11 +89,13 @@ def ts(
 @app.command()
 def invalid():
     """Check for invalid fields"""
+    from src.meta import Base
+
     base = Base.new()
     check_invalid(base)
 
 
-def check_invalid(base: Base) -> None:
+def check_invalid(base: "Base") -> None:
     print("Checking for invalid fields")
     invalid_found = False
     for table in base.tables:
@@ -108,6 +122,11 @@ def all(
     py_package_prefix: Annotated[str, Option(help="Use if the code is not generated at the root level of the package")] = "",
 ):
     """Generate json, CSV, Python, and TypeScript code."""
+    from src.csv import generate_csv
+    from src.meta import Base, generate_meta
+    from src.python import generate_python
+    from src.typescript import generate_typescript
+
     csv_folder_path = create_folder(csv_folder) if csv_folder else None
     base = Base.new(csv_folder=csv_folder_path)
 
@@ -9,6 +9,9 @@ from src.meta import MODEL_NAME, PROPERTY_NAME, Base
 from src.python import python_type
 from src.typescript import typescript_type
 
+# Write buffer for CSV exports, so a whole fields.csv is flushed in a few large writes
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 # Column definitions for CSV exports
 TABLE_COLUMNS = [
     "Table ID",
@@ -33,43 +36,46 @@ def generate_csv(base: Base, folder: Path, fresh: bool):
     print("Generating CSVs")
     use_custom = not fresh
 
-    # Generate tables CSV
-    tables_csv_path = Path(folder) / "tables.csv"
-    with open(tables_csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS)
-        writer.writeheader()
-        for table in base.tables:
-            writer.writerow(
-                {
-                    "Table ID": table.id,
-                    "Table Name": table.name,
-                    PROPERTY_NAME: table.name_snake(use_custom=use_custom),
-                    MODEL_NAME: to_snake(table.name_model(use_custom=use_custom)),
-                }
-            )
-    print(f"[dim] - Table CSV exported to '{tables_csv_path}'[/]")
+    tables_csv_path = folder / "tables.csv"
+    fields_output_path = folder / "fields.csv"
+    use_custom_fields = use_custom and fields_output_path.exists()
 
-    # Generate fields CSV
-    fields_output_path = Path(folder) / "fields.csv"
-    use_custom = use_custom and fields_output_path.exists()
+    # Generate both CSVs in a single pass over the tables
+    with (
+        open(tables_csv_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as tables_file,
+        open(fields_output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as fields_file,
+    ):
+        # Rows are tuples in TABLE_COLUMNS / FIELD_COLUMNS order
+        tables_writer = csv.writer(tables_file)
+        tables_writer.writerow(TABLE_COLUMNS)
+        fields_writer = csv.writer(fields_file)
+        fields_writer.writerow(FIELD_COLUMNS)
 
-    with open(fields_output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELD_COLUMNS)
-        writer.writeheader()
         for table in base.tables:
-            for field in table.fields:
-                writer.writerow(
-                    {
-                        "Table ID": table.id,
-                        "Table Name": table.name,
-                        "Field ID": field.id,
-                        "Field Name": sanitize_string(field.name),
-                        PROPERTY_NAME: field.name_snake(use_custom=use_custom),
-                        "Airtable Type": field.type,
-                        "Python Type": python_type(field),
-                        "TypeScript Type": typescript_type(field),
-                    }
+            table_id = table.id
+            table_name = table.name
+            tables_writer.writerow(
+                (
+                    table_id,
+                    table_name,
+                    table.name_snake(use_custom=use_custom),
+                    to_snake(table.name_model(use_custom=use_custom)),
                 )
+            )
+            fields_writer.writerows(
+                (
+                    table_id,
+                    table_name,
+                    field.id,
+                    sanitize_string(field.name),
+                    field.name_snake(use_custom=use_custom_fields),
+                    field.type,
+                    python_type(field),
+                    typescript_type(field),
+                )
+                for field in table.fields
+            )
+    print(f"[dim] - Table CSV exported to '{tables_csv_path}'[/]")
     print(f"[dim] - Fields CSV exported to '{fields_output_path}'[/]")
     print("[green] - CSV generation complete.[/]")
     print("")
@@ -1,10 +1,11 @@
 import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 # Compile regex patterns once at module level for performance
 _MULTI_SPACE_PATTERN = re.compile(r" {2,}")
-_CHARS_TO_SPACE_PATTERN = re.compile(r"[()[\]{}<>'`|\\.:,]")
+_SPACE_RUN_PATTERN = re.compile(r" +")
 
 # Multi-character replacements (order matters for some)
 _MULTI_CHAR_REPLACEMENTS: list[tuple[str, str]] = [
@@ -39,6 +40,21 @@ _SINGLE_CHAR_REPLACEMENTS: dict[str, str] = {
     "~": " tilde ",
 }
 
+# Brackets and punctuation that simply become spaces
+_CHARS_TO_SPACE: str = "()[]{}<>'`|\\.:,"
+
+# All single-character substitutions, applied in one pass by str.translate
+_CHAR_REPLACEMENTS = str.maketrans({**_SINGLE_CHAR_REPLACEMENTS, **dict.fromkeys(_CHARS_TO_SPACE, " ")})
+
+# Deletes every non-letter ASCII character, for the ASCII fast path of upper_alpha
+_NON_ALPHA_ASCII = str.maketrans("", "", "".join(chr(i) for i in range(128) if not chr(i).isalpha()))
+
+# Names reserved by pyairtable, and their replacements
+_RESERVED_NAMES: dict[str, str] = {
+    "id": "identifier",
+    "created_time": "created_at_time",
+}
+
 # Ordinal number mappings for sanitize_leading_trailing_characters
 _ORDINAL_REPLACEMENTS: dict[str, tuple[str, int]] = {
     "1st": ("first", 3),
@@ -54,6 +70,7 @@ _ORDINAL_REPLACEMENTS: dict[str, tuple[str, int]] = {
 }
 
 
+@lru_cache(maxsize=None)
 def sanitize_property_name(text: str) -> str:
     """Sanitizes the property name to remove any characters that are not allowed in property names."""
     # Handle special suffixes
@@ -67,13 +84,8 @@ def sanitize_property_name(text: str) -> str:
         if old in text:
             text = text.replace(old, new)
 
-    # Apply single character to word replacements
-    for char, replacement in _SINGLE_CHAR_REPLACEMENTS.items():
-        if char in text:
-            text = text.replace(char, replacement)
-
-    # Replace brackets and punctuation with spaces using single regex
-    text = _CHARS_TO_SPACE_PATTERN.sub(" ", text)
+    # Apply single character replacements (words, or spaces for brackets and punctuation) in one pass
+    text = text.translate(_CHAR_REPLACEMENTS)
 
     return text
 
@@ -83,31 +95,39 @@ def remove_extra_spaces(text: str) -> str:
     return _MULTI_SPACE_PATTERN.sub(" ", text)
 
 
+def spaces_to_underscores(text: str) -> str:
+    """Replaces each run of spaces with a single underscore in one regex pass."""
+    return _SPACE_RUN_PATTERN.sub("_", text)
+
+
+@lru_cache(maxsize=None)
 def sanitize_leading_trailing_characters(text: str) -> str:
     """Sanitizes leading and trailing characters, to deal with characters that are not allowed and/or desired in property names."""
     # Strip leading/trailing spaces and underscores
-    text = text.lstrip(" _").rstrip(" _")
+    text = text.strip(" _")
 
     if text and text[0].isdigit():
-        # Check for ordinal numbers using dictionary lookup
-        for ordinal, (word, length) in _ORDINAL_REPLACEMENTS.items():
-            if text.startswith(ordinal):
-                return word + text[length:]
+        # Check for ordinal numbers using dictionary lookup on the prefix
+        ordinal = _ORDINAL_REPLACEMENTS.get(text[:3]) or _ORDINAL_REPLACEMENTS.get(text[:4])
+        if ordinal:
+            word, length = ordinal
+            return word + text[length:]
         # Default: prefix with n_
         return f"n_{text}"
 
     return text
 
 
-def sanitize_reserved_names(text: str) -> str:
-    """Some names are reserved by the pyairtable library and cannot be used as property names."""
+def upper_alpha(text: str) -> str:
+    """Keeps only the alphabetic characters of the text, in UPPERCASE."""
+    if text.isascii():
+        return text.translate(_NON_ALPHA_ASCII).upper()
+    return "".join(c for c in text if c.isalpha()).upper()
 
-    if text == "id":
-        text = "identifier"
-    if text == "created_time":
-        text = "created_at_time"
 
-    return text
+def sanitize_reserved_names(text: str) -> str:
+    """Some names are reserved by the pyairtable library and cannot be used as property names."""
+    return _RESERVED_NAMES.get(text, text)
 
 
 def sanitize_string(text: str) -> str:
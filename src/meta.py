@@ -11,7 +11,14 @@ from pydantic import BaseModel, PrivateAttr
 from pydantic.alias_generators import to_camel, to_pascal
 from rich import print
 
-from src.helpers import remove_extra_spaces, sanitize_leading_trailing_characters, sanitize_property_name, sanitize_reserved_names
+from src.helpers import (
+    remove_extra_spaces,
+    sanitize_leading_trailing_characters,
+    sanitize_property_name,
+    sanitize_reserved_names,
+    spaces_to_underscores,
+    upper_alpha,
+)
 from src.meta_types import BaseMetadata, FieldType
 
 PROPERTY_NAME = "Property Name (snake_case)"
@@ -24,6 +31,20 @@ _MAX_DELAY = 60.0  # seconds
 _BACKOFF_MULTIPLIER = 2.0
 _JITTER = 0.5  # ±50% randomization
 
+# Reuse a cached metadata response (see AIRTABLE_META_CACHE) for up to this long
+_META_CACHE_MAX_AGE = 300.0  # seconds
+
+# Shared HTTP client (created on first use), so retries and repeated calls reuse one keep-alive connection
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=30.0)
+    return _client
+
 
 def _fetch_with_retry(url: str, headers: dict[str, str]) -> httpx.Response:
     """Fetch URL with exponential backoff and jitter on transient errors."""
@@ -32,7 +53,7 @@ def _fetch_with_retry(url: str, headers: dict[str, str]) -> httpx.Response:
 
     for attempt in range(1, _MAX_RETRIES + 1):
         try:
-            response = httpx.get(url, headers=headers, timeout=30.0)
+            response = _get_client().get(url, headers=headers)
 
             # Handle rate limiting (429) with retry
             if response.status_code == 429:
@@ -72,6 +93,27 @@ def _fetch_with_retry(url: str, headers: dict[str, str]) -> httpx.Response:
 
 
 def get_base_meta_data() -> BaseMetadata:
+    cache_path = get_meta_cache_path()
+    if cache_path and cache_path.exists() and time.time() - cache_path.stat().st_mtime < _META_CACHE_MAX_AGE:
+        content = cache_path.read_bytes()
+    else:
+        content = _fetch_base_meta_data()
+        if cache_path:
+            # Write to a temporary file and swap it in, so a concurrent run never reads a partial cache
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, cache_path)
+
+    data: BaseMetadata = json.loads(content)
+    data["tables"].sort(key=lambda t: t["name"].lower())
+    for table in data["tables"]:
+        table["fields"].sort(key=lambda f: f["name"].lower())
+    return data
+
+
+def _fetch_base_meta_data() -> bytes:
+    """Fetch the raw base metadata JSON from the Airtable API."""
     api_key = os.getenv("AIRTABLE_API_KEY")
     if not api_key:
         raise Exception("AIRTABLE_API_KEY not found in environment")
@@ -80,12 +122,16 @@ def get_base_meta_data() -> BaseMetadata:
     url = f"https://api.airtable.com/v0/meta/bases/{base_id}/tables"
 
     response = _fetch_with_retry(url, headers={"Authorization": f"Bearer {api_key}"})
+    return response.content
 
-    data: BaseMetadata = response.json()
-    data["tables"].sort(key=lambda t: t["name"].lower())
-    for table in data["tables"]:
-        table["fields"].sort(key=lambda f: f["name"].lower())
-    return data
+
+def get_meta_cache_path() -> Path | None:
+    """Get the optional on-disk metadata cache path from environment variable, keyed by base ID (e.g. cache.app123.json)."""
+    cache_path = os.getenv("AIRTABLE_META_CACHE")
+    if not cache_path:
+        return None
+    path = Path(cache_path)
+    return path.with_name(f"{path.stem}.{get_base_id()}{path.suffix}")
 
 
 def get_base_id() -> str:
@@ -145,58 +191,47 @@ class Options(BaseModel):
 
 
 class CsvCache:
-    """Cache for CSV lookups - provides O(1) access by ID."""
+    """Cache for CSV lookups - provides O(1) access by ID. Only the custom-name columns are kept."""
+
+    COLUMNS: tuple[str, ...] = (PROPERTY_NAME, MODEL_NAME)
 
     def __init__(self, csv_folder: Path | None = None):
         self.fields: dict[str, dict[str, str]] = {}  # field_id -> {column: value}
         self.tables: dict[str, dict[str, str]] = {}  # table_id -> {column: value}
 
         if csv_folder:
-            self._load_fields(csv_folder / "fields.csv")
-            self._load_tables(csv_folder / "tables.csv")
-
-    def _load_fields(self, path: Path) -> None:
-        if not path.exists():
-            return
-        with open(path, newline="", encoding="utf-8") as f:
-            for row in DictReader(f):
-                field_id = row.get("Field ID")
-                if field_id:
-                    self.fields[field_id] = dict(row)
+            self.fields = self._load(csv_folder / "fields.csv", id_column="Field ID")
+            self.tables = self._load(csv_folder / "tables.csv", id_column="Table ID")
 
-    def _load_tables(self, path: Path) -> None:
+    @classmethod
+    def _load(cls, path: Path, id_column: str) -> dict[str, dict[str, str]]:
+        """Load a CSV into an ID-keyed lookup table. Values are stripped once here, and blank values are dropped."""
+        rows: dict[str, dict[str, str]] = {}
         if not path.exists():
-            return
+            return rows
         with open(path, newline="", encoding="utf-8") as f:
             for row in DictReader(f):
-                table_id = row.get("Table ID")
-                if table_id:
-                    self.tables[table_id] = dict(row)
+                row_id = row.get(id_column)
+                if row_id:
+                    rows[row_id] = {key: value for key in cls.COLUMNS if (value := (row.get(key) or "").strip())}
+        return rows
 
     def get_field_value(self, field_id: str, key: str) -> str | None:
         """Get a value for a field by ID and column key. O(1) lookup."""
         row = self.fields.get(field_id)
-        if row and key in row:
-            value = row[key]
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-        return None
+        return row.get(key) if row else None
 
     def get_table_value(self, table_id: str, key: str) -> str | None:
         """Get a value for a table by ID and column key. O(1) lookup."""
         row = self.tables.get(table_id)
-        if row and key in row:
-            value = row[key]
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-        return None
+        return row.get(key) if row else None
 
 
 class TableOrField(BaseModel):
     id: str
     name: str
     # Memoization cache for computed property names (prevents redundant string operations)
-    _name_cache: dict[str, str] = PrivateAttr(default_factory=dict)
+    _name_cache: dict[tuple[str, bool] | str, str] = PrivateAttr(default_factory=dict)
 
     def is_table(self) -> bool:
         return hasattr(self, "primary_field_id")
@@ -212,8 +247,7 @@ class TableOrField(BaseModel):
         text = self.name
 
         text = sanitize_property_name(text)
-        text = remove_extra_spaces(text)
-        text = text.replace(" ", "_")
+        text = spaces_to_underscores(text)
         text = text.lower()
         text = sanitize_leading_trailing_characters(text)
         text = sanitize_reserved_names(text)
@@ -241,44 +275,102 @@ class TableOrField(BaseModel):
 
     def name_snake(self, use_custom: bool = True) -> str:
         """Get the property name in snake_case. Cached after first call."""
-        cache_key = f"snake_{use_custom}"
-        if cache_key not in self._name_cache:
-            self._name_cache[cache_key] = self._property_name(use_custom=use_custom)
-        return self._name_cache[cache_key]
+        cache = self._name_cache
+        cache_key = ("snake", use_custom)
+        name = cache.get(cache_key)
+        if name is None:
+            name = cache[cache_key] = self._property_name(use_custom=use_custom)
+        return name
 
     def name_camel(self, use_custom: bool = True) -> str:
         """Get the property name in camelCase. Cached after first call."""
-        cache_key = f"camel_{use_custom}"
-        if cache_key not in self._name_cache:
-            self._name_cache[cache_key] = to_camel(self._property_name(use_custom=use_custom))
-        return self._name_cache[cache_key]
+        cache = self._name_cache
+        cache_key = ("camel", use_custom)
+        name = cache.get(cache_key)
+        if name is None:
+            name = cache[cache_key] = to_camel(self.name_snake(use_custom=use_custom))
+        return name
 
     def name_pascal(self, use_custom: bool = True) -> str:
         """Get the property name in PascalCase. Cached after first call."""
-        cache_key = f"pascal_{use_custom}"
-        if cache_key not in self._name_cache:
-            self._name_cache[cache_key] = to_pascal(self._property_name(use_custom=use_custom))
-        return self._name_cache[cache_key]
+        cache = self._name_cache
+        cache_key = ("pascal", use_custom)
+        name = cache.get(cache_key)
+        if name is None:
+            name = cache[cache_key] = to_pascal(self.name_snake(use_custom=use_custom))
+        return name
 
     def name_model(self, use_custom: bool = True) -> str:
         """Get the model name (PascalCase with 'Model' suffix). Cached after first call."""
-        cache_key = f"model_{use_custom}"
-        if cache_key not in self._name_cache:
+        cache = self._name_cache
+        cache_key = ("model", use_custom)
+        name = cache.get(cache_key)
+        if name is None:
+            text = None
             if use_custom and hasattr(self, "base") and self.base and self.base._csv_cache:
                 text = self._custom_property_name(key=MODEL_NAME)
-                if text:
-                    text = text.replace(" ", "_")
-                    self._name_cache[cache_key] = to_pascal(text)
-                    return self._name_cache[cache_key]
-            self._name_cache[cache_key] = self.name_pascal(use_custom=use_custom) + "Model"
-        return self._name_cache[cache_key]
+            if text:
+                name = to_pascal(text.replace(" ", "_"))
+            else:
+                name = self.name_pascal(use_custom=use_custom) + "Model"
+            cache[cache_key] = name
+        return name
 
     def name_upper(self) -> str:
         """Get the name with only alphabetic characters in UPPERCASE. Cached after first call."""
-        cache_key = "upper"
-        if cache_key not in self._name_cache:
-            self._name_cache[cache_key] = "".join(c for c in self.name if c.isalpha()).upper()
-        return self._name_cache[cache_key]
+        cache = self._name_cache
+        name = cache.get("upper")
+        if name is None:
+            name = cache["upper"] = upper_alpha(self.name)
+        return name
+
+
+# Field types whose value is dependent on other fields
+CALCULATED_TYPES: frozenset[FieldType] = frozenset({"formula", "rollup", "lookup", "multipleLookupValues"})
+
+# Field types that may carry select choices, either directly or on their result
+SELECT_OPTION_TYPES: frozenset[FieldType] = frozenset({"singleSelect", "multipleSelects", "singleCollaborator", "multipleLookupValues", "formula"})
+
+# Field types whose value is calculated by Airtable, and thus read-only
+COMPUTED_TYPES: frozenset[FieldType] = frozenset(
+    {
+        "formula",
+        "rollup",
+        "lookup",
+        "multipleLookupValues",
+        "createdTime",
+        "lastModifiedTime",
+        "lastModifiedBy",
+        "createdBy",
+        "count",
+        "button",
+    }
+)
+
+# Airtable type → myAirtable formula class mappings (anything else is a TextField)
+FORMULA_CLASSES: dict[str, str] = {
+    "singleLineText": "TextField",
+    "multilineText": "TextField",
+    "url": "TextField",
+    "richText": "TextField",
+    "email": "TextField",
+    "phoneNumber": "TextField",
+    "barcode": "TextField",
+    "checkbox": "BooleanField",
+    "date": "DateField",
+    "dateTime": "DateField",
+    "createdTime": "DateField",
+    "lastModifiedTime": "DateField",
+    "count": "NumberField",
+    "autoNumber": "NumberField",
+    "percent": "NumberField",
+    "currency": "NumberField",
+    "duration": "NumberField",
+    "number": "NumberField",
+    "multipleAttachments": "AttachmentsField",
+    "multipleSelects": "MultiSelectField",
+    "singleSelect": "SingleSelectField",
+}
 
 
 class Field(TableOrField):
@@ -297,35 +389,15 @@ class Field(TableOrField):
 
     def is_valid(self) -> bool:
         """Check if the field is `valid` according to Airtable."""
-        if self.options and hasattr(self.options, "is_valid"):
-            return bool(self.options.is_valid)
-        return True
+        return self.options is None or bool(self.options.is_valid)
 
     def is_calculated(self) -> bool:
         """A field whose value is dependent on other fields."""
-        calculated_types: list[FieldType] = [
-            "formula",
-            "rollup",
-            "lookup",
-            "multipleLookupValues",
-        ]
-        return self.type in calculated_types
+        return self.type in CALCULATED_TYPES
 
     def is_computed(self) -> bool:
         """A field whose value is calculated by Airtable, and thus read-only."""
-        computed_types: list[FieldType] = [
-            "formula",
-            "rollup",
-            "lookup",
-            "multipleLookupValues",
-            "createdTime",
-            "lastModifiedTime",
-            "lastModifiedBy",
-            "createdBy",
-            "count",
-            "button",
-        ]
-        return self.type in computed_types
+        return self.type in COMPUTED_TYPES
 
     def result_type(self) -> FieldType:
         if self.options:
@@ -353,84 +425,32 @@ class Field(TableOrField):
 
     def involves_lookup(self) -> bool:
         """Check if a field involves multipleLookupValues, either directly or through any referenced fields."""
-        # Check memoization cache first
-        if self.id in self.base._involves_lookup_cache:
-            return self.base._involves_lookup_cache[self.id]
-
-        # Compute result
-        if self.type == "multipleLookupValues" or self.type == "lookup":
-            result = True
-        elif self.options is None:
-            result = False
-        else:
-            result = False
-            # Check if field has referencedFieldIds and recursively check each one
-            referenced_field_ids = self.options.referenced_field_ids or []
-            for referenced_field_id in referenced_field_ids:
-                # field_by_id uses O(1) index lookup and returns None if not found
-                referenced_field = self.base.field_by_id(referenced_field_id)
-                if referenced_field and referenced_field.involves_lookup():
-                    result = True
-                    break
-
-        # Cache and return result
-        self.base._involves_lookup_cache[self.id] = result
-        return result
+        return self.base._involves_lookup_cache[self.id]
 
     def involves_rollup(self) -> bool:
         """Check if a field involves rollup, either directly or through any referenced fields."""
-        # Check memoization cache first
-        if self.id in self.base._involves_rollup_cache:
-            return self.base._involves_rollup_cache[self.id]
-
-        # Compute result
-        if self.type == "rollup":
-            result = True
-        elif self.options is None:
-            result = False
-        else:
-            result = False
-            # Check if field has referencedFieldIds and recursively check each one
-            referenced_field_ids = self.options.referenced_field_ids or []
-            for referenced_field_id in referenced_field_ids:
-                # field_by_id uses O(1) index lookup and returns None if not found
-                referenced_field = self.base.field_by_id(referenced_field_id)
-                if referenced_field and referenced_field.involves_rollup():
-                    result = True
-                    break
-
-        # Cache and return result
-        self.base._involves_rollup_cache[self.id] = result
-        return result
+        return self.base._involves_rollup_cache[self.id]
 
     def select_options(self) -> list[str]:
         """Get the options of a select field. Cached after first call."""
-        # Return cached result if available
-        if self._select_options_cache is not None:
-            return self._select_options_cache
-
-        airtable_type = self.type
-
-        if (
-            airtable_type == "singleSelect"
-            or airtable_type == "multipleSelects"
-            or airtable_type == "singleCollaborator"
-            or airtable_type == "multipleLookupValues"
-            or airtable_type == "formula"
-        ):
-            if self.options:
-                if self.options.choices:
-                    options = [choice.name for choice in self.options.choices]
-                    options.sort()
-                    self._select_options_cache = options
-                    return options
-                elif self.options.result:
-                    if self.options.result.options:
-                        if self.options.result.options.choices:
-                            options = [choice.name for choice in self.options.result.options.choices]
-                            options.sort()
-                            self._select_options_cache = options
-                            return options
+        # Return cached result if available (read once: pydantic private attributes are resolved through __getattr__)
+        cached = self._select_options_cache
+        if cached is not None:
+            return cached
+
+        choices = None
+        options = self.options
+        if options and self.type in SELECT_OPTION_TYPES:
+            choices = options.choices
+            if not choices:
+                result = options.result
+                result_options = result.options if result else None
+                choices = result_options.choices if result_options else None
+
+        if choices:
+            names = sorted(choice.name for choice in choices)
+            self._select_options_cache = names
+            return names
 
         self._select_options_cache = []
         return []
@@ -442,31 +462,12 @@ class Field(TableOrField):
         """Returns the appropriate myAirtable formula type for a given Airtable field."""
 
         airtable_type: FieldType = self.type
-        formula_type: str = "TextField"
 
         # With calculated fields, we want to know the type of the result
         if self.is_calculated():
             airtable_type = self.result_type()
 
-        match airtable_type:
-            case "singleLineText" | "multilineText" | "url" | "richText" | "email" | "phoneNumber" | "barcode":
-                formula_type = "TextField"
-            case "checkbox":
-                formula_type = "BooleanField"
-            case "date" | "dateTime" | "createdTime" | "lastModifiedTime":
-                formula_type = "DateField"
-            case "count" | "autoNumber" | "percent" | "currency" | "duration" | "number":
-                formula_type = "NumberField"
-            case "multipleAttachments":
-                formula_type = "AttachmentsField"
-            case "multipleSelects":
-                formula_type = "MultiSelectField"
-            case "singleSelect":
-                formula_type = "SingleSelectField"
-            case _:
-                formula_type = "TextField"
-
-        return formula_type
+        return FORMULA_CLASSES.get(airtable_type, "TextField")
 
 
 class View(BaseModel):
@@ -537,7 +538,7 @@ class Base(BaseModel):
     tables: list[Table]
     _original_metadata: BaseMetadata
     _csv_cache: CsvCache | None = None
-    # Memoization caches for recursive field analysis (prevents exponential traversal)
+    # Precomputed tables for involves_lookup/involves_rollup (built once after loading)
     _involves_lookup_cache: dict[str, bool] = {}
     _involves_rollup_cache: dict[str, bool] = {}
     # Indexes for O(1) lookups (built once after loading)
@@ -545,7 +546,7 @@ class Base(BaseModel):
     _table_index: dict[str, "Table"] = {}
     # Cached computed properties (lazy initialization)
     _select_fields_cache: list["Field"] | None = None
-    _select_field_ids_cache: list[str] | None = None
+    _select_field_ids_cache: frozenset[str] | None = None
 
     @classmethod
     def new(cls, csv_folder: Path | None = None) -> "Base":
@@ -556,9 +557,6 @@ class Base(BaseModel):
         )
         base._original_metadata = meta
         base._csv_cache = CsvCache(csv_folder) if csv_folder else None
-        # Initialize fresh caches for this base instance
-        base._involves_lookup_cache = {}
-        base._involves_rollup_cache = {}
         for table_meta in meta["tables"]:
             table = Table(
                 id=table_meta["id"],
@@ -617,8 +615,34 @@ class Base(BaseModel):
             for field in table.fields:
                 base._field_index[field.id] = field
 
+        base._build_involves_caches()
+
         return base
 
+    def _build_involves_caches(self) -> None:
+        """Precompute involves_lookup/involves_rollup for every field. Iterative and safe with circular references."""
+        # Reverse reference index: field ID -> IDs of the fields that reference it
+        referenced_by: dict[str, list[str]] = {}
+        for field in self._field_index.values():
+            if field.options and field.options.referenced_field_ids:
+                for referenced_field_id in field.options.referenced_field_ids:
+                    referenced_by.setdefault(referenced_field_id, []).append(field.id)
+
+        self._involves_lookup_cache = self._propagate_involves(referenced_by, ("multipleLookupValues", "lookup"))
+        self._involves_rollup_cache = self._propagate_involves(referenced_by, ("rollup",))
+
+    def _propagate_involves(self, referenced_by: dict[str, list[str]], types: tuple[FieldType, ...]) -> dict[str, bool]:
+        """Mark fields of the given types, and every field that references one (transitively), as involved."""
+        involved = dict.fromkeys(self._field_index, False)
+        stack = [field.id for field in self._field_index.values() if field.type in types]
+        while stack:
+            field_id = stack.pop()
+            if involved[field_id]:
+                continue
+            involved[field_id] = True
+            stack.extend(referenced_by.get(field_id, ()))
+        return involved
+
     def to_dict(self) -> BaseMetadata:
         return self._original_metadata
 
@@ -648,10 +672,10 @@ class Base(BaseModel):
             self._select_fields_cache = [field for field in self.fields() if field.select_options()]
         return self._select_fields_cache
 
-    def select_fields_ids(self) -> list[str]:
-        """Get IDs of all fields with select options. Cached after first call."""
+    def select_fields_ids(self) -> frozenset[str]:
+        """Get IDs of all fields with select options, as a set for O(1) membership tests. Cached after first call."""
         if self._select_field_ids_cache is None:
-            self._select_field_ids_cache = [field.id for field in self.select_fields()]
+            self._select_field_ids_cache = frozenset(field.id for field in self.select_fields())
         return self._select_field_ids_cache
 
     def select_field_by_id(self, field_id: str) -> Field | None:
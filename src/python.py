@@ -718,8 +718,9 @@ SIMPLE_PYTHON_TYPES: dict[str, str] = {
 def python_type(field: Field) -> str:
     """Returns the appropriate Python type for a given Airtable field. Cached after first call."""
     # Return cached result if available
-    if field._python_type_cache is not None:
-        return field._python_type_cache
+    cached = field._python_type_cache
+    if cached is not None:
+        return cached
 
     airtable_type: FieldType = field.type
 
@@ -758,7 +759,7 @@ def python_type(field: Field) -> str:
     # TODO: In the case of some calculated fields, sometimes the result is just too unpredictable.
     # Although the type prediction is basically right, I haven't figured out how to predict if
     # it's a list or not, and sometimes the result is a list with a single null value.
-    if "list" not in py_type:
+    if not py_type.startswith("list["):
         if field.involves_lookup() or field.involves_rollup():
             py_type = f"list[{py_type} | None] | {py_type}"
 
@@ -801,14 +802,14 @@ def pyairtable_orm_type(field: Field, base: Base, output_folder: Path, package_p
     is_read_only: bool = field.is_computed()
 
     # With formula/rollup fields, we want to know the type of the result
-    if field.type in ["formula", "rollup"]:
+    if field.type in ("formula", "rollup"):
         airtable_type = field.result_type()
 
-    params = f'field_name="{original_id}"' + (", readonly=True" if is_read_only else "")
+    params = f'field_name="{original_id}"{", readonly=True" if is_read_only else ""}'
 
     # Handle simple type mappings via lookup
-    if airtable_type in SIMPLE_ORM_TYPES:
-        orm_class = SIMPLE_ORM_TYPES[airtable_type]
+    orm_class = SIMPLE_ORM_TYPES.get(airtable_type)
+    if orm_class:
         return f"{orm_class} = {orm_class}({params})"
 
     # Handle complex types with special logic
@@ -825,16 +826,16 @@ def pyairtable_orm_type(field: Field, base: Base, output_folder: Path, package_p
             return f"LookupField = LookupField[{python_type(field)}]({params})"
         case "multipleRecordLinks":
             if field.options and field.options.linked_table_id:
-                table_id: str = field.options.linked_table_id
-                for table in base.tables:
-                    if table.id == table_id:
-                        linked_orm_class = table.name_model()
-                        break
-                prefix = f"{package_prefix}.{output_folder.stem}.dynamic.models" if package_prefix else f"{output_folder.stem}.dynamic.models"
-                if field.options.prefers_single_record_link:
-                    return f'"{linked_orm_class}" = SingleLinkField["{linked_orm_class}"]({params}, model="{prefix}.{table.name_snake()}.{linked_orm_class}") # type: ignore'
-                return f'list["{linked_orm_class}"] = LinkField["{linked_orm_class}"]({params}, model="{prefix}.{table.name_snake()}.{linked_orm_class}") # type: ignore'
-            print(field.table.name, original_id, sanitize_string(field.name), "[yellow]does not have a linkedTableId[/]")
+                linked_table = base.table_by_id(field.options.linked_table_id)
+                if linked_table:
+                    linked_orm_class = linked_table.name_model()
+                    prefix = f"{package_prefix}.{output_folder.stem}.dynamic.models" if package_prefix else f"{output_folder.stem}.dynamic.models"
+                    if field.options.prefers_single_record_link:
+                        return f'"{linked_orm_class}" = SingleLinkField["{linked_orm_class}"]({params}, model="{prefix}.{linked_table.name_snake()}.{linked_orm_class}") # type: ignore'
+                    return f'list["{linked_orm_class}"] = LinkField["{linked_orm_class}"]({params}, model="{prefix}.{linked_table.name_snake()}.{linked_orm_class}") # type: ignore'
+                print(field.table.name, original_id, sanitize_string(field.name), "[yellow]linked table not found in base[/]")
+            else:
+                print(field.table.name, original_id, sanitize_string(field.name), "[yellow]does not have a linkedTableId[/]")
         case _:
             pass
 
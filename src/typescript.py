@@ -642,8 +642,9 @@ SIMPLE_TS_TYPES: dict[str, str] = {
 def typescript_type(field: Field) -> str:
     """Returns the appropriate TypeScript type for a given Airtable field. Cached after first call."""
     # Return cached result if available
-    if field._typescript_type_cache is not None:
-        return field._typescript_type_cache
+    cached = field._typescript_type_cache
+    if cached is not None:
+        return cached
 
     airtable_type: FieldType = field.type
     ts_type: str = "any"
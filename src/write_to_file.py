@@ -7,6 +7,16 @@ from pydantic import BaseModel
 PROPERTY_NAME = "Property Name (snake_case)"
 MODEL_NAME = "Model Name (snake_case)"
 
+# Header written at the top of every generated file, by language
+_BANNER = "=" * 42
+_HEADERS: dict[str, str] = {
+    language: f"{comment} {_BANNER}\n{comment} Auto-generated file. Do not edit directly.\n{comment} {_BANNER}\n\n"
+    for language, comment in (("python", "#"), ("typescript", "//"))
+}
+
+# Precomputed indent prefixes for line_indented
+_INDENTS: tuple[str, ...] = tuple("    " * i for i in range(8))
+
 
 class WriteToFile(BaseModel):
     """Abstracts file writing operations with buffered single-write output."""
@@ -22,22 +32,8 @@ class WriteToFile(BaseModel):
         if exc_type is None:
             os.makedirs(self.path.parent, exist_ok=True)
 
-            # Build header based on language
-            if self.language == "python":
-                header = (
-                    "# ==========================================\n"
-                    "# Auto-generated file. Do not edit directly.\n"
-                    "# ==========================================\n\n"
-                )
-            else:
-                header = (
-                    "// ==========================================\n"
-                    "// Auto-generated file. Do not edit directly.\n"
-                    "// ==========================================\n\n"
-                )
-
             # Single write operation: header + all lines joined
-            content = header + "\n".join(self.lines) + ("\n" if self.lines else "")
+            content = _HEADERS[self.language] + "\n".join(self.lines) + ("\n" if self.lines else "")
 
             # Write mode truncates/creates file (no need to delete first)
             with open(self.path, "w") as f:
@@ -50,4 +46,5 @@ class WriteToFile(BaseModel):
         self.lines.append("")
 
     def line_indented(self, text: str, indent: int = 1):
-        self.lines.append("    " * indent + text)
+        prefix = _INDENTS[indent] if 0 <= indent < len(_INDENTS) else "    " * indent
+        self.lines.append(prefix + text)